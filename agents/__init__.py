@@ -1,3 +1,5 @@
 from .base_agent import BaseAgent
+from .config_loader import load_agent_configs, precompile_schemas
+from .dispatch_table import DispatchTable, build_dispatch_table, run_tasks
 
-__all__ = ["BaseAgent"]
\ No newline at end of file
+__all__ = ["BaseAgent", "load_agent_configs", "precompile_schemas", "DispatchTable", "build_dispatch_table", "run_tasks"]
@@ -1,6 +1,41 @@
 from abc import ABC, abstractmethod
+import functools
+import importlib
+import json
 import logging
-from typing import Any, Callable, List, Optional, Dict
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+try:
+    import fastjsonschema  # optional dependency, preferred backend
+except ImportError:
+    fastjsonschema = None
+
+try:
+    from jsonschema import exceptions as _jsonschema_exceptions  # optional dependency
+    from jsonschema import validators as _jsonschema_validators
+except ImportError:
+    _jsonschema_exceptions = _jsonschema_validators = None
+
+try:
+    import msgspec  # optional dependency, used when a config declares struct_model
+except ImportError:
+    msgspec = None
+
+try:
+    import orjson  # optional dependency, faster canonical JSON for validator cache keys
+except ImportError:
+    orjson = None
+
+# Both accept str or bytes, so either kind of cache key round-trips
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Compile errors that depend only on the schema itself, so caching them as a failure is safe
+_SCHEMA_ERRORS: Tuple[type, ...] = ()
+if fastjsonschema is not None:
+    _SCHEMA_ERRORS += (fastjsonschema.JsonSchemaDefinitionException,)
+if _jsonschema_exceptions is not None:
+    _SCHEMA_ERRORS += (_jsonschema_exceptions.SchemaError,)
 
 class Color:
     """ANSI color codes for styled console output."""
@@ -22,6 +57,144 @@ if not logger.handlers:
     console_handler.setFormatter(formatter)
     logger.addHandler(console_handler)
 
+# Module logger under a name that BaseAgent's `logger` parameters don't shadow
+_MODULE_LOGGER: logging.Logger = logger
+
+# Shared read-only config used when an agent is built without agent_config_dict
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# Module-level aliases so the templates below don't go through Color attribute lookups
+_BLUE, _CYAN, _GREEN, _YELLOW = Color.BLUE, Color.CYAN, Color.GREEN, Color.YELLOW
+_BOLD, _END = Color.BOLD, Color.END
+
+# Color-wrapped fragments and %-templates of log_agent_details(), built once at import
+_HEADER = f"{_CYAN}------------------------ 🤖 Agent Details ------------------------{_END}"
+_FOOTER = f"{_CYAN}------------------------------------------------------------------{_END}"
+_RAG_LINE = f"This agent will use {_BLUE}RAG Technology{_END}"
+_IDENTITY_FMT = f"{_BOLD}%s{_END} is initialized as {_YELLOW}%s{_END} role | Agent_id = {_GREEN}%s{_END}"
+_LLM_FMT = f"Agent LLM: {_BLUE}%s{_END}"
+_VECTOR_STORE_FMT = f"{_RAG_LINE} | Vector Store: {_GREEN}%s{_END}"
+_MEMORY_FMT = f"This agent will also use Memory associated to {_YELLOW}%s{_END}"
+_TOOLS_FMT = f"Tools available for this agent: {_GREEN}%s{_END}"
+_INTERACTIONS_FMT = f"Interacts with other agents: {_CYAN}%s{_END}"
+
+
+# fastjsonschema options shared with config_loader.precompile_schemas(). use_default=False:
+# validation must not write schema defaults into the payload. use_formats=False: "format"
+# stays an annotation, as in the jsonschema fallback, so results don't depend on the backend.
+_FASTJSONSCHEMA_OPTIONS: Dict[str, bool] = {"use_default": False, "use_formats": False}
+
+
+def _build_validator(schema: Dict, trusted: bool = False) -> Any:
+    """
+    Build a jsonschema validator instance for the given schema.
+
+    The schema is checked against its meta-schema once here, so the returned
+    validator can be reused for any number of payloads without repeating that work.
+    The check is skipped for trusted schemas (configs shipped with the repo).
+    Schemas without a "$schema" use Draft-07, the draft fastjsonschema applies to them.
+    """
+    if _jsonschema_validators is None:
+        raise ImportError("fastjsonschema or jsonschema is required for schema validation")
+    cls = _jsonschema_validators.validator_for(schema, default=_jsonschema_validators.Draft7Validator)
+    if not trusted:
+        cls.check_schema(schema)
+    return cls(schema)
+
+
+def _compile_validator(schema: Dict, trusted: bool = False) -> Callable[[Any], Any]:
+    """
+    Compile a schema into a callable that raises on invalid payloads.
+
+    Uses fastjsonschema (code-generated validator) when installed and falls back
+    to a cached jsonschema validator otherwise.
+    """
+    if fastjsonschema is not None:
+        return fastjsonschema.compile(schema, **_FASTJSONSCHEMA_OPTIONS)
+    return _build_validator(schema, trusted).validate
+
+
+def _rejecting_validator(error: Exception) -> Callable[[Any], Any]:
+    """Stand-in validator for a schema that failed to compile: raises error for every payload."""
+    def reject(payload: Any) -> Any:
+        raise error.with_traceback(None)
+    return reject
+
+
+@functools.lru_cache(maxsize=256)
+def _get_validator(schema_json: Union[str, bytes], trusted: bool = False) -> Callable[[Any], Any]:
+    """
+    Return the shared compiled validator for a canonical (sorted-keys) schema JSON key.
+
+    Agents built from the same config, or from configs with equal schemas, hit the
+    same cache entry, so each distinct schema is compiled once per process.
+    An invalid schema (_SCHEMA_ERRORS) is cached as a validator raising that error, so it
+    is not recompiled on every call; other failures (e.g. an unreachable remote $ref or a
+    missing library) propagate uncached and are retried. Always pass trusted positionally
+    so equal calls share one cache key.
+    """
+    try:
+        return _compile_validator(_json_loads(schema_json), trusted)
+    except _SCHEMA_ERRORS as e:
+        return _rejecting_validator(e)
+
+
+def _resolve_struct_model(struct_model: Any, agent_name: str) -> Any:
+    """
+    Resolve a dotted path like ``"pkg.models.ResearchInput"`` to the class it names.
+    Raises ValueError if the path has no module part and ImportError if it can't be resolved.
+    """
+    if not isinstance(struct_model, str):
+        return struct_model
+    module_name, _, attr = struct_model.rpartition(".")
+    if not module_name or not attr:
+        raise ValueError(
+            f"[{agent_name}] struct_model must be a dotted path like 'pkg.module.Class', got {struct_model!r}")
+    try:
+        return getattr(importlib.import_module(module_name), attr)
+    except (ImportError, AttributeError) as e:
+        raise ImportError(f"[{agent_name}] cannot resolve struct_model {struct_model!r}: {e}") from e
+
+
+def _schema_key(schema: Optional[Dict]) -> Optional[Union[str, bytes]]:
+    """
+    Canonical JSON cache key for a schema, or None when no schema is set.
+    Uses orjson (bytes) when installed; stdlib json (str) otherwise or for anything
+    orjson refuses to serialize.
+
+    The key is computed from the schema's current contents on every call, so a schema
+    edited in place gets a fresh key (and validator) the next time it is assigned.
+    A schema that is not plain JSON (e.g. holds a set) has no key either; see _validator_for().
+    """
+    if not schema:
+        return None
+    key: Union[str, bytes, None] = None
+    if orjson is not None:
+        try:
+            key = orjson.dumps(schema, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            pass
+    if key is None:
+        try:
+            key = json.dumps(schema, sort_keys=True)
+        except (TypeError, ValueError):
+            return None
+    return key
+
+
+def _validator_for(schema: Dict, key: Optional[Union[str, bytes]], trusted: bool) -> Callable[[Any], Any]:
+    """
+    Return the validator for a non-empty schema and its _schema_key().
+    Schemas without a key can't go through the shared cache, so they are compiled directly
+    (an invalid one again becomes a validator raising the compile error).
+    """
+    if key is not None:
+        return _get_validator(key, trusted)
+    try:
+        return _compile_validator(schema, trusted)
+    except _SCHEMA_ERRORS as e:
+        return _rejecting_validator(e)
+
 
 class BaseAgent(ABC):
     """
@@ -34,28 +207,41 @@ class BaseAgent(ABC):
     Attributes:
         agent_name (str): Name of the agent.
         agent_description (str): Brief description of the agent's purpose.
-        agent_tools (List[Any]): Tools available to the agent.
+        agent_tools (Sequence[Any]): Tools available to the agent.
         llm (str): Language model used by the agent.
         agent_id (int): Unique identifier for the agent.
-        agent_config_dict (Optional[dict]): Optional configuration dictionary.
+        agent_config_dict (Mapping): Read-only view of the configuration dictionary.
         agent_memory (Optional[Any]): Optional memory object associated with the agent.
         agent_persona (Optional[str]): Optional persona of the agent.
         agent_prompt (Optional[str]): Optional prompt string for agent behavior.
         verbose (bool): Flag to enable verbose logging.
-        logger (Optional[logging.Logger]): Custom logger if provided.
+        logger (logging.Logger): Logger used by the agent; the module logger unless one is provided.
         update_strategy (Optional[Callable]): Optional callable for update strategy.
         agent_role (Optional[str]): Role of the agent.
         rag_enabled (bool): Flag indicating if RAG (Retrieval-Augmented Generation) is enabled.
         vector_store (Optional[str]): Name of the vector store if RAG is enabled.
     """
 
+    # Fixed attribute layout: no per-instance __dict__. Subclasses should declare
+    # their own __slots__ (empty if they add no attributes) to keep the benefit.
+    __slots__ = (
+        "llm", "agent_name", "agent_description", "agent_tools", "agent_id",
+        "agent_config_dict", "agent_memory", "agent_persona", "agent_prompt",
+        "verbose", "logger", "update_strategy", "agent_role", "rag_enabled",
+        "vector_store", "interactions", "show_logger", "capabilities", "struct_model",
+        "_tools_owned", "_task_dispatch", "_schema_trusted",
+        "_input_schema", "_input_schema_key", "_input_validator",
+        "_output_schema", "_output_schema_key", "_output_validator",
+        "__weakref__",
+    )
+
     def __init__(self, *,
                  agent_name: str,
                  agent_description: str,
-                 agent_tools: Optional[List[Any]] = None,
+                 agent_tools: Optional[Sequence[Any]] = None,
                  llm: str,
                  agent_id: int,
-                 agent_config_dict: Optional[Dict] = None,
+                 agent_config_dict: Optional[Mapping[str, Any]] = None,
                  agent_memory: Optional[Any] = None,
                  agent_persona: Optional[str] = None,
                  agent_prompt: Optional[str] = None,
@@ -63,10 +249,13 @@ class BaseAgent(ABC):
                  logger: Optional[logging.Logger] = None,
                  update_strategy: Optional[Callable] = None,
                  agent_role: Optional[str] = None,
-                 rag_enabled: bool = False,
+                 rag_enabled: Optional[bool] = None,
                  vector_store: Optional[str] = None,
                  interactions: Optional[str] = None,
-                 show_logger: bool = True):
+                 show_logger: bool = True,
+                 input_validator: Optional[Callable] = None,
+                 output_validator: Optional[Callable] = None,
+                 trusted: bool = False):
 
         """
         Initialize the agent with required attributes.
@@ -74,10 +263,12 @@ class BaseAgent(ABC):
         Args:
             agent_name (str): Name of the agent.
             agent_description (str): Brief description of the agent.
-            agent_tools (Optional[List[Any]]): Tools available to the agent. Defaults to [].
+            agent_tools (Optional[Sequence[Any]]): Tools available to the agent. Defaults to the
+                config's "tools" entry, or no tools.
             llm (str): Language model used by the agent.
             agent_id (int): Unique identifier for the agent.
-            agent_config_dict (Optional[Dict]): Optional configuration dictionary.
+            agent_config_dict (Optional[Mapping]): Optional configuration dictionary. Stored as a
+                zero-copy read-only view; use dict(agent.agent_config_dict) for a mutable copy.
             agent_memory (Optional[Any]): Optional memory object.
             agent_persona (Optional[str]): Optional persona description.
             agent_prompt (Optional[str]): Optional prompt string.
@@ -85,42 +276,150 @@ class BaseAgent(ABC):
             logger (Optional[logging.Logger]): Optional custom logger.
             update_strategy (Optional[Callable]): Optional callable for update strategy.
             agent_role (Optional[str]): Role of the agent. Defaults to None.
-            rag_enabled (bool): Whether Retrieval-Augmented Generation is enabled. Defaults to False.
-            vector_store (Optional[str]): Name of the vector store if RAG is enabled.
+            rag_enabled (Optional[bool]): Whether Retrieval-Augmented Generation is enabled.
+                When None (the default), uses the config's rag.enabled, else False.
+            vector_store (Optional[str]): Name of the vector store if RAG is enabled. Defaults to the
+                config's vector_store or rag.vector_store.
             interactions (Optional[str]): Defines other agents this agent communicates or collaborates with.
+            show_logger (bool): Whether announce() logs the agent's details. Defaults to True.
+            input_validator (Optional[Callable]): Precompiled validator for input_schema
+                (see config_loader.precompile_schemas). Compiled lazily when omitted.
+            output_validator (Optional[Callable]): Precompiled validator for output_schema.
+            trusted (bool): Skip the jsonschema meta-schema check for this config's schemas. Pass True
+                only for configs the deployment controls, e.g. from load_agent_configs(). Defaults to False.
         """
 
         self.llm: str = llm
         self.agent_name: str = agent_name
         self.agent_description: str = agent_description
-        # avoid mutable default at signature: normalize here
-        self.agent_tools: List[Any] = list(agent_tools) if agent_tools else []
+        # read-only view shared with the caller: no copy, and agents can't mutate the config
+        if isinstance(agent_config_dict, MappingProxyType):
+            self.agent_config_dict: Mapping[str, Any] = agent_config_dict
+        else:
+            self.agent_config_dict = MappingProxyType(agent_config_dict) if agent_config_dict else _EMPTY
+        # keep a reference to the caller's (or config's) sequence; add_tool() copies it on first write
+        if agent_tools is None:
+            agent_tools = self.agent_config_dict.get("tools", ())
+        self.agent_tools: Sequence[Any] = agent_tools
+        self._tools_owned: bool = False
         self.agent_id: int = agent_id
-        self.agent_config_dict: Optional[Dict] = agent_config_dict
         self.agent_memory: Optional[Any] = agent_memory
         self.agent_persona: Optional[str] = agent_persona
         self.agent_prompt: Optional[str] = agent_prompt
         self.verbose: bool = verbose
-        # prefer a provided logger, otherwise use module-level logger
-        self.logger: logging.Logger = logger if logger is not None else logger  # will be replaced below
-        # Note: avoid shadowing name 'logger' variable; use module logger as fallback
-        if logger is None:
-            self.logger = globals().get("logger")
+        # prefer a provided logger, otherwise use the module-level logger; never None
+        self.logger: logging.Logger = logger if logger is not None else _MODULE_LOGGER
         self.update_strategy: Optional[Callable] = update_strategy
         self.agent_role: Optional[str] = agent_role
-        self.rag_enabled: bool = rag_enabled
-        self.vector_store: Optional[str] = vector_store
+        # explicit arguments win; otherwise fall back to the config's "rag" block (looked up once)
+        rag_cfg = self.agent_config_dict.get("rag")
+        if not isinstance(rag_cfg, Mapping):
+            rag_cfg = _EMPTY
+        self.rag_enabled: bool = bool(rag_enabled) if rag_enabled is not None else bool(
+            rag_cfg.get("enabled", self.agent_config_dict.get("rag_enabled", False)))
+        self.vector_store: Optional[str] = (
+            vector_store or self.agent_config_dict.get("vector_store") or rag_cfg.get("vector_store"))
         self.interactions: Optional[str] = interactions
         self.show_logger: bool = show_logger
-        self.capabilities: List[str] = agent_config_dict.get("capabilities", []) if agent_config_dict else []
+        # frozenset for O(1) membership in can_handle(); capabilities_list keeps config order
+        self.capabilities: FrozenSet[str] = frozenset(self.agent_config_dict.get("capabilities", ()))
+        self._task_dispatch: Optional[Dict[str, Callable[[Dict], Dict]]] = None
+        # trusted configs (the repo's own, via load_agent_configs()) skip the meta-schema check
+        self._schema_trusted: bool = trusted
+        # validators come from the shared cache and are dropped whenever a schema is swapped
         self.input_schema = self.agent_config_dict.get("input_schema")
         self.output_schema = self.agent_config_dict.get("output_schema")
-        self.logger: logging.Logger = logger if logger is not None else globals().get("logger")
+        self._input_validator: Optional[Callable] = input_validator
+        self._output_validator: Optional[Callable] = output_validator
+        # optional msgspec.Struct type; when set, validate_input() decodes into it instead of using input_schema
+        self.struct_model: Optional[Any] = _resolve_struct_model(
+            self.agent_config_dict.get("struct_model"), agent_name)
+        # compile the input validator now so the first task doesn't pay for it
+        if self._input_validator is None and self.struct_model is None and self._input_schema:
+            try:
+                self._input_validator = _validator_for(self._input_schema, self._input_schema_key, self._schema_trusted)
+            except Exception:
+                pass  # not a schema error (e.g. network): validate_input() retries and logs it
+
+    @property
+    def input_schema(self) -> Optional[Dict]:
+        """JSON Schema used by validate_input()."""
+        return self._input_schema
+
+    @input_schema.setter
+    def input_schema(self, schema: Optional[Dict]) -> None:
+        self._input_schema = schema
+        self._input_schema_key = _schema_key(schema)
+        self._input_validator = None
+
+    @property
+    def output_schema(self) -> Optional[Dict]:
+        """JSON Schema used by validate_output()."""
+        return self._output_schema
+
+    @output_schema.setter
+    def output_schema(self, schema: Optional[Dict]) -> None:
+        self._output_schema = schema
+        self._output_schema_key = _schema_key(schema)
+        self._output_validator = None
+
+    @classmethod
+    def build_many(cls, configs: Mapping[str, Mapping[str, Any]], *,
+                   llm: str,
+                   start_id: int = 1,
+                   logger: Optional[logging.Logger] = None,
+                   show_logger: bool = True,
+                   **agent_kwargs: Any) -> List["BaseAgent"]:
+        """
+        Build one agent of this class per config (e.g. the output of load_agent_configs()).
+
+        - Each config name becomes the agent_name; agent ids are assigned from start_id.
+        - Each distinct schema is compiled once; agents share validators through the module cache.
+        - Agents are created with show_logger=False and a single summary record is logged
+          in place of per-agent announce() banners.
+        - Configs that are not JSON objects or carry an "error" key are skipped with a warning.
+        Extra keyword arguments are forwarded to every constructor call; pass trusted=True
+        for configs from load_agent_configs() to skip the meta-schema check.
+        """
+        log = logger if logger is not None else _MODULE_LOGGER
+        agents: List[BaseAgent] = []
+        for name, cfg in configs.items():
+            if not isinstance(cfg, Mapping):
+                log.warning("[%s] skipped: config is not a JSON object", name)
+                continue
+            if "error" in cfg:
+                log.warning("[%s] skipped: %s", name, cfg["error"])
+                continue
+            agents.append(cls(
+                agent_name=name,
+                agent_description=cfg.get("description", ""),
+                llm=llm,
+                agent_id=start_id + len(agents),
+                agent_config_dict=cfg,
+                logger=log,
+                show_logger=False,
+                **agent_kwargs,
+            ))
+
+        if show_logger and agents:
+            log.info("Initialized %d agents: %s", len(agents), ", ".join(a.agent_name for a in agents))
+        return agents
+
+    def add_tool(self, tool: Any) -> None:
+        """
+        Add a tool to this agent.
+        agent_tools is copied into a private list on the first call, so the sequence
+        passed at construction (or shared from the config) is never mutated.
+        """
+        if not self._tools_owned:
+            self.agent_tools = list(self.agent_tools)
+            self._tools_owned = True
+        self.agent_tools.append(tool)
 
-        # Log the agent's initialization details
-        if self.show_logger:
-            self.log_agent_details()
-            print()
+    @property
+    def capabilities_list(self) -> List[str]:
+        """Capabilities in the order they are declared in agent_config_dict."""
+        return list(self.agent_config_dict.get("capabilities", ()))
 
     @abstractmethod
     def update_persona(self, persona: str) -> None:
@@ -146,6 +445,15 @@ class BaseAgent(ABC):
         """Retrieve the agent's processing chain or workflow."""
         pass
 
+    def announce(self) -> None:
+        """
+        Log the agent's details if show_logger is set.
+        Construction never logs; call this once the agent is ready to be reported.
+        """
+        if self.show_logger:
+            self.log_agent_details()
+            self.logger.info("")
+
     def log_agent_details(self) -> None:
         """
         Log detailed information about the agent.
@@ -153,43 +461,42 @@ class BaseAgent(ABC):
         Includes agent name, role, ID, LLM, RAG usage, memory, tools, and interactions.
         Provides a visually formatted output using ANSI color codes.
         """
-        log = self.logger if self.logger is not None else globals().get("logger")
+        log = self.logger
+        if not log.isEnabledFor(logging.INFO):
+            return
 
         # Header
-        log.info(Color.CYAN + "------------------------ 🤖 Agent Details ------------------------" + Color.END)
+        log.info(_HEADER)
 
         # Name and role
-        log.info(
-            f"{Color.BOLD}{self.agent_name}{Color.END} is initialized as {Color.YELLOW}{self.agent_role}{Color.END} role | "
-            f"Agent_id = {Color.GREEN}{self.agent_id}{Color.END}"
-        )
+        log.info(_IDENTITY_FMT, self.agent_name, self.agent_role, self.agent_id)
 
         # LLM information
         if self.llm:
-            log.info(f"Agent LLM: {Color.BLUE}{self.llm}{Color.END}")
+            log.info(_LLM_FMT, self.llm)
 
         # RAG information
         if self.rag_enabled:
-            rag_line = f"This agent will use {Color.BLUE}RAG Technology{Color.END}"
             if self.vector_store:
-                rag_line += f" | Vector Store: {Color.GREEN}{self.vector_store}{Color.END}"
-            log.info(rag_line)
+                log.info(_VECTOR_STORE_FMT, self.vector_store)
+            else:
+                log.info(_RAG_LINE)
 
         # Memory information
         if self.agent_memory:
-            log.info(f"This agent will also use Memory associated to {Color.YELLOW}{self.agent_memory}{Color.END}")
+            log.info(_MEMORY_FMT, self.agent_memory)
 
         # Tools information
         if self.agent_tools:
-            tools_list = ", ".join(str(tool) for tool in self.agent_tools)
-            log.info(f"Tools available for this agent: {Color.GREEN}{tools_list}{Color.END}")
+            tools_list = ", ".join(map(str, self.agent_tools))
+            log.info(_TOOLS_FMT, tools_list)
 
         # Interactions information
         if self.interactions:
-            log.info(f"Interacts with other agents: {Color.CYAN}{self.interactions}{Color.END}")
+            log.info(_INTERACTIONS_FMT, self.interactions)
 
         # Footer
-        log.info(Color.CYAN + "------------------------------------------------------------------" + Color.END)
+        log.info(_FOOTER)
     
     def can_handle(self, task: Dict) -> bool:
         """
@@ -198,39 +505,133 @@ class BaseAgent(ABC):
         """
         if not isinstance(task, dict):
             return False
-        task_type = task.get("task_type")
-        return bool(task_type and task_type in self.capabilities)
+        try:
+            return task.get("task_type") in self.capabilities
+        except TypeError:  # unhashable task_type can't be a capability
+            return False
     
-    @abstractmethod
+    def build_task_dispatch(self) -> Dict[str, Callable[[Dict], Dict]]:
+        """
+        Build the task_type -> handler table used by the default execute_task().
+        A handler is a ``do_<capability>`` method; capabilities without one are left out.
+        Called lazily on the first execute_task(); subclasses may call it from build_agent().
+        """
+        dispatch = {}
+        for capability in self.capabilities:
+            handler = getattr(self, f"do_{capability}", None)
+            if handler is not None:
+                dispatch[capability] = handler
+        self._task_dispatch = dispatch
+        return dispatch
+
     def execute_task(self, task: Dict) -> Dict:
         """
         Execute the provided task and return a result dict.
-        Concrete agents must implement this entrypoint used by the Planner.
+        This is the entrypoint used by the Planner. The default routes task["task_type"]
+        to the matching ``do_<task_type>`` method in a single dict lookup and returns an
+        {"error": ...} dict for unhandled types. Agents may override it entirely.
         """
-        raise NotImplementedError
+        dispatch = self._task_dispatch
+        if dispatch is None:
+            dispatch = self.build_task_dispatch()
+        task_type = task.get("task_type")
+        try:
+            handler = dispatch.get(task_type)
+        except TypeError:  # unhashable task_type can't be a capability
+            handler = None
+        if handler is None:
+            return {"error": f"unhandled task_type: {task_type!r}"}
+        return handler(task)
 
     def validate_input(self, payload: Dict) -> bool:
         """
-        Validate payload against input_schema using jsonschema.
+        Validate payload against input_schema using fastjsonschema or jsonschema.
+        - If struct_model is set, the payload is converted with msgspec instead.
         - Returns True if no schema is defined or if validation passes.
         - Returns False and logs a warning if validation fails.
+        The validator is compiled at construction (or, if the schema was swapped, on the
+        next call) and reused afterwards; an invalid schema is rejected with its compile
+        error without being compiled again, other compile failures are retried next call.
         """
+        if self.struct_model is not None:
+            return self._validate_struct(payload)
         if not self.input_schema:
             return True
         try:
-            import jsonschema  # optional dependency
-            jsonschema.validate(instance=payload, schema=self.input_schema)
+            if self._input_validator is None:
+                self._input_validator = _validator_for(
+                    self._input_schema, self._input_schema_key, self._schema_trusted)
+            self._input_validator(payload)
             return True
         except Exception as e:
-            log = self.logger or globals().get("logger")
-            if log:
-                log.warning(f"[{self.agent_name}] input validation failed: {e}")
+            self.logger.warning("[%s] input validation failed: %s", self.agent_name, e)
+            return False
+
+    def validate_inputs(self, payloads: Iterable[Dict]) -> List[bool]:
+        """
+        Validate a batch of payloads against input_schema.
+        Same result as [self.validate_input(p) for p in payloads], but the validator and
+        logger are looked up once for the whole batch instead of once per payload.
+        """
+        payloads = list(payloads)
+        if self.struct_model is not None:
+            return [self._validate_struct(payload) for payload in payloads]
+        if not self.input_schema:
+            return [True] * len(payloads)
+        try:
+            if self._input_validator is None:
+                self._input_validator = _validator_for(
+                    self._input_schema, self._input_schema_key, self._schema_trusted)
+        except Exception as e:
+            self.logger.warning("[%s] input validation failed: %s", self.agent_name, e)
+            return [False] * len(payloads)
+
+        validator = self._input_validator
+        warn = self.logger.warning
+        agent_name = self.agent_name
+        results = [False] * len(payloads)
+        for i, payload in enumerate(payloads):
+            try:
+                validator(payload)
+                results[i] = True
+            except Exception as e:
+                warn("[%s] input validation failed: %s", agent_name, e)
+        return results
+
+    def _validate_struct(self, payload: Dict) -> bool:
+        """Validate payload by converting it into self.struct_model with msgspec."""
+        try:
+            if msgspec is None:
+                raise ImportError("msgspec is required when struct_model is configured")
+            msgspec.convert(payload, self.struct_model)
+            return True
+        except Exception as e:
+            self.logger.warning("[%s] input validation failed: %s", self.agent_name, e)
+            return False
+
+    def validate_output(self, result: Dict) -> bool:
+        """
+        Validate a task result against output_schema.
+        Mirrors validate_input(): True if no schema is defined or validation passes,
+        otherwise False with a logged warning.
+        """
+        if not self.output_schema:
+            return True
+        try:
+            if self._output_validator is None:
+                self._output_validator = _validator_for(
+                    self._output_schema, self._output_schema_key, self._schema_trusted)
+            self._output_validator(result)
+            return True
+        except Exception as e:
+            self.logger.warning("[%s] output validation failed: %s", self.agent_name, e)
             return False
 
 if __name__ == "__main__":
     # Concrete implementations of BaseAgent (subclasses)
     class MyAgent(BaseAgent):
         """Example agent subclass implementing BaseAgent."""
+        __slots__ = ()
         def update_persona(self, persona: str) -> None: 
             pass
         def run_agent(self) -> None: 
@@ -246,6 +647,7 @@ if __name__ == "__main__":
 
     class ResearchAgent(BaseAgent):
         """Research-focused agent subclass implementing BaseAgent."""
+        __slots__ = ()
         def update_persona(self, persona: str) -> None:
             pass
         def run_agent(self) -> None:
@@ -261,6 +663,7 @@ if __name__ == "__main__":
 
     class SecurityAgent(BaseAgent):
         """Security monitoring agent subclass implementing BaseAgent."""
+        __slots__ = ()
         def update_persona(self, persona: str) -> None:
             pass
         def run_agent(self) -> None:
@@ -314,4 +717,7 @@ if __name__ == "__main__":
         vector_store=None,
         agent_memory=None,
         interactions="HelperBot, ResearchBot"
-    )
\ No newline at end of file
+    )
+
+    for agent in (agent1, agent2, agent3):
+        agent.announce()
\ No newline at end of file
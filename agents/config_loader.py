@@ -0,0 +1,168 @@
+import hashlib
+import importlib.util
+import json
+import os
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from .base_agent import _FASTJSONSCHEMA_OPTIONS
+
+try:
+    import fastjsonschema  # optional dependency
+except ImportError:
+    fastjsonschema = None
+
+try:
+    import orjson  # optional dependency, faster JSON parsing
+except ImportError:
+    orjson = None
+
+# orjson decodes UTF-8 bytes directly; stdlib json.loads also accepts bytes
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Directory holding the JSON agent configs shipped with the repo
+CONFIG_DIR: Path = Path(__file__).resolve().parent.parent / "agent_config_settings"
+
+# Default location for validator modules generated by precompile_schemas()
+COMPILED_SCHEMA_DIR: Path = Path(__file__).resolve().parent / "_compiled_schemas"
+
+_SCHEMA_KEYS = ("input_schema", "output_schema")
+
+# String leaves shorter than this are interned along with every key
+_INTERN_MAX_LEN = 64
+
+# Parsed configs keyed by resolved path -> (st_mtime_ns, st_size, config)
+_cfg_cache: Dict[Path, Tuple[int, int, Dict]] = {}
+
+
+def _intern_tree(obj: Any) -> Any:
+    """
+    Return a copy of a parsed JSON tree with every dict key and short string interned.
+
+    Configs repeat the same keys and small values ("type", "properties", "string", ...);
+    interning makes them one shared object each, and dict lookups on interned keys can
+    match by identity instead of comparing characters.
+    """
+    if isinstance(obj, dict):
+        return {sys.intern(k): _intern_tree(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_intern_tree(x) for x in obj]
+    if isinstance(obj, str) and len(obj) < _INTERN_MAX_LEN:
+        return sys.intern(obj)
+    return obj
+
+
+def _read_one(path: Path) -> Tuple[str, Dict]:
+    """Read, parse and intern a single config file, returning ``(stem, config_or_error)``."""
+    try:
+        return path.stem, _intern_tree(_json_loads(path.read_bytes()))
+    except Exception as e:
+        return path.stem, {"error": str(e)}
+
+
+def load_agent_configs(config_dir: Path = CONFIG_DIR, force_reload: bool = False) -> Dict[str, Dict]:
+    """
+    Load every ``*.json`` agent config in config_dir.
+
+    Parsed configs are memoized per file on ``(st_mtime_ns, st_size)``, so repeated calls
+    only stat the files and re-parse the ones that changed. Stale files are read and parsed
+    on a thread pool (orjson when installed, stdlib json otherwise). Pass force_reload=True
+    to bypass the cache.
+
+    Configs loaded here come from a directory the deployment controls, so agents built from
+    them can pass ``trusted=True`` (to BaseAgent or build_many()) to skip the jsonschema
+    meta-schema check.
+
+    Returns a fresh dict mapping the file stem (e.g. ``"critic_agent"``) to the parsed config.
+    The config dicts themselves are shared with the cache; copy one before mutating it.
+    A file that cannot be read or parsed maps to ``{"error": <message>}`` instead of
+    aborting the whole load.
+    """
+    configs: Dict[str, Optional[Dict]] = {}
+    stale: List[Tuple[Path, Tuple[int, int]]] = []
+    for path in sorted(Path(config_dir).resolve().glob("*.json")):
+        try:
+            st = path.stat()
+        except OSError as e:
+            configs[path.stem] = {"error": str(e)}
+            continue
+        signature = (st.st_mtime_ns, st.st_size)
+        cached = _cfg_cache.get(path)
+        if not force_reload and cached is not None and cached[:2] == signature:
+            configs[path.stem] = cached[2]
+        else:
+            configs[path.stem] = None  # placeholder keeps file-name order
+            stale.append((path, signature))
+
+    if stale:
+        with ThreadPoolExecutor(max_workers=min(32, len(stale))) as ex:
+            parsed = ex.map(_read_one, [path for path, _ in stale])
+            for (path, signature), (stem, cfg) in zip(stale, parsed):
+                _cfg_cache[path] = (signature[0], signature[1], cfg)
+                configs[stem] = cfg
+    return configs
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    """
+    Write text to path via a temp file in the same directory and os.replace(), so a
+    concurrent reader (another CI job or deploy) never imports a half-written module.
+    The file gets the usual 0o666 & ~umask mode rather than mkstemp's private 0o600,
+    so processes running as other users can import it.
+    """
+    umask = os.umask(0)
+    os.umask(umask)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.stem}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.chmod(tmp, 0o666 & ~umask)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def precompile_schemas(configs: Mapping[str, Mapping],
+                       output_dir: Optional[Path] = None) -> Dict[str, Dict[str, Callable]]:
+    """
+    Generate fastjsonschema validator modules for each config's schemas and import them.
+
+    Each schema is written to ``<name>_<schema_key>_<digest>.py`` under output_dir, where
+    digest is derived from the schema, the fastjsonschema version and the compile options,
+    so an existing module is imported as-is and only new or changed schemas (or a different
+    fastjsonschema) pay the code-generation cost. Run this in CI (or once at deploy time)
+    and pass the results to agents as ``input_validator`` / ``output_validator``.
+
+    Returns a dict mapping config name to ``{"input_schema": fn, "output_schema": fn}``
+    (only for the schemas each config defines). Configs carrying an ``"error"`` key are skipped.
+    """
+    if fastjsonschema is None:
+        raise ImportError("fastjsonschema is required to precompile schemas")
+
+    output_dir = Path(output_dir) if output_dir is not None else COMPILED_SCHEMA_DIR
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    # generated code depends on the library version and options, not just the schema
+    generator = f"fastjsonschema {fastjsonschema.VERSION} {json.dumps(_FASTJSONSCHEMA_OPTIONS, sort_keys=True)}\n"
+    compiled: Dict[str, Dict[str, Callable]] = {}
+    for name, cfg in configs.items():
+        if not isinstance(cfg, Mapping) or "error" in cfg:
+            continue
+        for key in _SCHEMA_KEYS:
+            schema = cfg.get(key)
+            if not schema:
+                continue
+            digest = hashlib.sha1((generator + json.dumps(schema, sort_keys=True)).encode("utf-8")).hexdigest()[:12]
+            module_name = f"{name}_{key}_{digest}"
+            path = output_dir / f"{module_name}.py"
+            if not path.exists():
+                _write_atomic(path, fastjsonschema.compile_to_code(schema, **_FASTJSONSCHEMA_OPTIONS))
+            spec = importlib.util.spec_from_file_location(module_name, path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            compiled.setdefault(name, {})[key] = module.validate
+    return compiled
@@ -0,0 +1,166 @@
+import sys
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Dict, FrozenSet, Hashable, Iterable, List, Mapping, Optional, Tuple
+
+
+class DispatchTable:
+    """
+    Inverted index from capability to the candidates that declare it.
+
+    Routing a task becomes one dict lookup on its task_type instead of calling
+    can_handle() on every agent. Candidates are returned in registration order.
+    Keys can be config names (build_dispatch_table) or agent instances (register_agent),
+    but only a table holding agents alone can route tasks with select_agent()/run_tasks().
+    """
+
+    __slots__ = ("_by_capability", "_candidates", "_capabilities", "_name_keyed")
+
+    def __init__(self) -> None:
+        # capability -> keys in registration order (dict used as an ordered set)
+        self._by_capability: Dict[str, Dict[Hashable, None]] = {}
+        # tuple snapshots handed out by candidates() and the capability set, rebuilt after add()
+        self._candidates: Dict[str, Tuple[Hashable, ...]] = {}
+        self._capabilities: Optional[FrozenSet[str]] = None
+        self._name_keyed: bool = False
+
+    def add(self, key: Hashable, capabilities: Iterable[str]) -> None:
+        """
+        Register key as a candidate for each of the given capabilities.
+        Capability strings are interned so that task types taken from configs (which
+        load_agent_configs() also interns) match the index keys by identity.
+        """
+        if not hasattr(key, "validate_input"):
+            self._name_keyed = True
+        by_capability = self._by_capability
+        for capability in capabilities:
+            if isinstance(capability, str):
+                capability = sys.intern(capability)
+            keys = by_capability.get(capability)
+            if keys is None:
+                by_capability[capability] = {key: None}
+                self._capabilities = None
+            elif key not in keys:
+                keys[key] = None
+            else:
+                continue
+            self._candidates.pop(capability, None)
+
+    def register_agent(self, agent: Any) -> None:
+        """Index an agent instance under each capability it declares."""
+        self.add(agent, agent.capabilities_list)
+
+    def select_agent(self, task: Dict) -> Optional[Any]:
+        """
+        Return the first registered agent for task["task_type"] whose validate_input()
+        accepts task["payload"], or None. Only agents declaring the capability are validated.
+        Raises TypeError if the table holds keys other than agents (e.g. config names).
+        """
+        if self._name_keyed:
+            raise TypeError("select_agent() needs a table of agents; register them with register_agent()")
+        payload = task.get("payload", {})
+        for agent in self.candidates(task.get("task_type")):
+            if agent.validate_input(payload):
+                return agent
+        return None
+
+    def candidates(self, task_type: Any) -> Tuple[Hashable, ...]:
+        """Return the candidates registered for task_type (empty tuple if none)."""
+        try:
+            cached = self._candidates.get(task_type)
+            if cached is None:
+                keys = self._by_capability.get(task_type)
+                if keys is None:
+                    return ()
+                cached = self._candidates[task_type] = tuple(keys)
+            return cached
+        except TypeError:  # unhashable task_type can't be a capability
+            return ()
+
+    @property
+    def capabilities(self) -> FrozenSet[str]:
+        """Union of all registered capabilities, for fast negative filtering."""
+        if self._capabilities is None:
+            self._capabilities = frozenset(self._by_capability)
+        return self._capabilities
+
+    def __contains__(self, task_type: Any) -> bool:
+        try:
+            return task_type in self._by_capability
+        except TypeError:
+            return False
+
+    def __len__(self) -> int:
+        return len(self._by_capability)
+
+
+def build_dispatch_table(configs: Mapping[str, Mapping]) -> DispatchTable:
+    """
+    Build a DispatchTable keyed by config name from load_agent_configs() output.
+    Configs carrying an ``"error"`` key are skipped. The table answers candidates() and
+    capability lookups; to route tasks, register the agents built from these configs instead.
+    """
+    table = DispatchTable()
+    for name, cfg in configs.items():
+        if not isinstance(cfg, Mapping) or "error" in cfg:
+            continue
+        table.add(name, cfg.get("capabilities", ()))
+    return table
+
+
+def run_tasks(table: DispatchTable, tasks: Iterable[Dict], max_workers: int = 3) -> Dict[str, Dict]:
+    """
+    Dispatch tasks to the agents registered in table, running independent tasks in parallel.
+
+    Each task is a dict with "task_id", "task_type", an optional "payload" and an optional
+    "dependencies" list of task_ids. A task is submitted to the thread pool as soon as all of
+    its dependencies have finished (Kahn's algorithm), so dependent tasks keep their order
+    while independent ones overlap. max_workers mirrors the planner's max_parallel_tasks default.
+
+    Returns {task_id: result} in the order the tasks were given. Raises RuntimeError if a task
+    has no suitable agent, reuses a task_id, depends on an unknown task, or the dependencies
+    form a cycle, and TypeError if table is not keyed by agents.
+    """
+    by_id: Dict[str, Dict] = {}
+    for task in tasks:
+        task_id = task["task_id"]
+        if task_id in by_id:
+            raise RuntimeError(f"Duplicate task_id {task_id}")
+        by_id[task_id] = task
+    remaining: Dict[str, int] = {}
+    dependents: Dict[str, List[str]] = {task_id: [] for task_id in by_id}
+    for task_id, task in by_id.items():
+        dependencies = task.get("dependencies") or ()
+        remaining[task_id] = len(dependencies)
+        for dependency in dependencies:
+            if dependency not in by_id:
+                raise RuntimeError(f"Task {task_id} depends on unknown task {dependency}")
+            dependents[dependency].append(task_id)
+
+    # bound once: the loops below run per task
+    select_agent = table.select_agent
+
+    def dispatch(task: Dict) -> Dict:
+        agent = select_agent(task)
+        if agent is None:
+            raise RuntimeError(f"No agent available to handle task {task['task_id']}")
+        return agent.execute_task(task)
+
+    results: Dict[str, Dict] = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        submit = ex.submit
+        running: Dict[Future, str] = {
+            submit(dispatch, by_id[task_id]): task_id for task_id, count in remaining.items() if count == 0
+        }
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                task_id = running.pop(future)
+                results[task_id] = future.result()
+                for dependent in dependents[task_id]:
+                    remaining[dependent] -= 1
+                    if remaining[dependent] == 0:
+                        running[submit(dispatch, by_id[dependent])] = dependent
+
+    if len(results) != len(by_id):
+        raise RuntimeError("Task dependencies contain a cycle")
+    return {task_id: results[task_id] for task_id in by_id}
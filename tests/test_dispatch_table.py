@@ -0,0 +1,99 @@
+import threading
+import unittest
+
+from agents import BaseAgent, DispatchTable, run_tasks
+
+
+class WorkerAgent(BaseAgent):
+    """Agent whose handlers record the order tasks run in; "rendezvous" tasks must run concurrently."""
+
+    __slots__ = ("order", "_lock", "barrier")
+
+    def __init__(self, barrier_parties: int = 2):
+        super().__init__(agent_name="worker", agent_description="test worker", llm="none", agent_id=1,
+                         agent_config_dict={"capabilities": ["echo", "rendezvous", "fail"]},
+                         show_logger=False)
+        self.order = []
+        self._lock = threading.Lock()
+        self.barrier = threading.Barrier(barrier_parties, timeout=5)
+
+    def update_persona(self, persona: str) -> None:
+        pass
+
+    def run_agent(self) -> None:
+        pass
+
+    def update_memory(self) -> None:
+        pass
+
+    def build_agent(self) -> None:
+        pass
+
+    def get_agent_chain(self):
+        pass
+
+    def do_echo(self, task):
+        with self._lock:
+            self.order.append(task["task_id"])
+        return {"echo": task.get("payload")}
+
+    def do_rendezvous(self, task):
+        self.barrier.wait()  # raises BrokenBarrierError unless both tasks are in flight at once
+        return self.do_echo(task)
+
+    def do_fail(self, task):
+        raise ValueError(f"task {task['task_id']} failed")
+
+
+class RunTasksTest(unittest.TestCase):
+
+    def setUp(self):
+        self.agent = WorkerAgent()
+        self.table = DispatchTable()
+        self.table.register_agent(self.agent)
+
+    def test_independent_tasks_run_in_parallel(self):
+        tasks = [{"task_id": "a", "task_type": "rendezvous", "payload": 1},
+                 {"task_id": "b", "task_type": "rendezvous", "payload": 2}]
+        results = run_tasks(self.table, tasks, max_workers=2)
+        self.assertEqual(results, {"a": {"echo": 1}, "b": {"echo": 2}})
+
+    def test_dependencies_run_first_and_results_keep_input_order(self):
+        tasks = [{"task_id": "c", "task_type": "echo", "dependencies": ["b"]},
+                 {"task_id": "b", "task_type": "echo", "dependencies": ["a"]},
+                 {"task_id": "a", "task_type": "echo"}]
+        results = run_tasks(self.table, tasks)
+        self.assertEqual(self.agent.order, ["a", "b", "c"])
+        self.assertEqual(list(results), ["c", "b", "a"])
+
+    def test_cycle_raises(self):
+        tasks = [{"task_id": "a", "task_type": "echo", "dependencies": ["b"]},
+                 {"task_id": "b", "task_type": "echo", "dependencies": ["a"]}]
+        with self.assertRaisesRegex(RuntimeError, "cycle"):
+            run_tasks(self.table, tasks)
+        self.assertEqual(self.agent.order, [])
+
+    def test_unknown_dependency_raises(self):
+        with self.assertRaisesRegex(RuntimeError, "unknown task z"):
+            run_tasks(self.table, [{"task_id": "a", "task_type": "echo", "dependencies": ["z"]}])
+
+    def test_duplicate_task_id_raises(self):
+        tasks = [{"task_id": "a", "task_type": "echo"}, {"task_id": "a", "task_type": "echo"}]
+        with self.assertRaisesRegex(RuntimeError, "Duplicate task_id a"):
+            run_tasks(self.table, tasks)
+        self.assertEqual(self.agent.order, [])
+
+    def test_task_without_agent_raises(self):
+        with self.assertRaisesRegex(RuntimeError, "No agent available"):
+            run_tasks(self.table, [{"task_id": "a", "task_type": "unknown"}])
+
+    def test_failing_task_propagates_its_exception(self):
+        tasks = [{"task_id": "a", "task_type": "fail"},
+                 {"task_id": "b", "task_type": "echo", "dependencies": ["a"]}]
+        with self.assertRaisesRegex(ValueError, "task a failed"):
+            run_tasks(self.table, tasks)
+        self.assertNotIn("b", self.agent.order)
+
+
+if __name__ == "__main__":
+    unittest.main()
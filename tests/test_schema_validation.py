@@ -0,0 +1,58 @@
+import unittest
+from unittest import mock
+
+from agents import base_agent, load_agent_configs
+
+
+def _research_document_schema():
+    """Item schema of research_agent's "Direct-documents mode" input (declares url as format: uri)."""
+    schema = load_agent_configs()["research_agent"]["input_schema"]
+    return schema["oneOf"][1]["properties"]["documents"]["items"]
+
+
+class FormatAnnotationTest(unittest.TestCase):
+    """"format" is an annotation on every backend, matching jsonschema.validate()'s default."""
+
+    document = {"id": "d1", "text": "body", "url": "not a uri"}
+
+    def assert_accepted(self, validator):
+        validator(self.document)  # raises if the payload is rejected
+        with self.assertRaises(Exception):
+            validator({"id": "d1", "text": "body", "url": 5})  # "type" is still enforced
+
+    @unittest.skipIf(base_agent.fastjsonschema is None, "fastjsonschema not installed")
+    def test_fastjsonschema_ignores_format(self):
+        self.assert_accepted(base_agent._compile_validator(_research_document_schema()))
+
+    @unittest.skipIf(base_agent._jsonschema_validators is None, "jsonschema not installed")
+    def test_jsonschema_fallback_ignores_format(self):
+        with mock.patch.object(base_agent, "fastjsonschema", None):
+            self.assert_accepted(base_agent._compile_validator(_research_document_schema()))
+
+
+class CompileFailureCacheTest(unittest.TestCase):
+    """Invalid schemas are compiled once; other compile failures are retried."""
+
+    def setUp(self):
+        base_agent._get_validator.cache_clear()
+
+    @unittest.skipIf(not base_agent._SCHEMA_ERRORS, "no schema validation library installed")
+    def test_invalid_schema_is_cached(self):
+        with mock.patch.object(base_agent, "_compile_validator", wraps=base_agent._compile_validator) as compile_:
+            for _ in range(3):
+                validator = base_agent._get_validator(base_agent._schema_key({"type": "nope"}), False)
+                with self.assertRaises(Exception):
+                    validator({})
+        self.assertEqual(compile_.call_count, 1)
+
+    def test_transient_failure_is_retried(self):
+        key = base_agent._schema_key({"type": "object"})
+        with mock.patch.object(base_agent, "_compile_validator", side_effect=OSError("unreachable $ref")):
+            with self.assertRaises(OSError):
+                base_agent._get_validator(key, False)
+        if base_agent._SCHEMA_ERRORS:
+            base_agent._get_validator(key, False)({})  # compiles now that the failure has cleared
+
+
+if __name__ == "__main__":
+    unittest.main()